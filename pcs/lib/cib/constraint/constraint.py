@@ -1,3 +1,5 @@
+from itertools import chain, islice
+
 from lxml import etree
 
 from pcs.common import reports
@@ -6,20 +8,25 @@ from pcs.common.reports.item import ReportItem
 from pcs.lib.cib import resource
 from pcs.lib.cib.constraint import resource_set
 from pcs.lib.cib.tools import (
+    IdProvider,
     find_unique_id,
     find_element_by_tag_and_id,
 )
 from pcs.lib.errors import LibraryError
-from pcs.lib.xml_tools import (
-    export_attributes,
-    find_parent,
+from pcs.lib.xml_tools import export_attributes
+
+_MULTIINSTANCE_TAGS = frozenset(resource.clone.ALL_TAGS + [resource.bundle.TAG])
+# master is a deprecated form of a promotable clone, report it as a clone
+_REPORTED_PARENT_TYPE = {resource.clone.TAG_MASTER: resource.clone.TAG_CLONE}
+_XP_MULTIINSTANCE_PARENT = etree.XPath(
+    "ancestor::*[{0}][1]".format(
+        " or ".join(f"self::{tag}" for tag in sorted(_MULTIINSTANCE_TAGS))
+    )
 )
 
 
 def _validate_attrib_names(attrib_names, options):
-    invalid_names = [
-        name for name in options.keys() if name not in attrib_names
-    ]
+    invalid_names = [name for name in options if name not in attrib_names]
     if invalid_names:
         raise LibraryError(
             ReportItem.error(
@@ -33,29 +40,32 @@ def _validate_attrib_names(attrib_names, options):
 def find_valid_resource_id(
     report_processor: ReportProcessor, cib, in_clone_allowed, _id
 ):
-    parent_tags = resource.clone.ALL_TAGS + [resource.bundle.TAG]
     resource_element = find_element_by_tag_and_id(
-        sorted(parent_tags + [resource.primitive.TAG, resource.group.TAG]),
+        sorted(
+            _MULTIINSTANCE_TAGS | {resource.primitive.TAG, resource.group.TAG}
+        ),
         cib,
         _id,
     )
+    resource_id = resource_element.get("id")
 
-    if resource_element.tag in parent_tags:
-        return resource_element.attrib["id"]
+    if resource_element.tag in _MULTIINSTANCE_TAGS:
+        return resource_id
 
-    clone = find_parent(resource_element, parent_tags)
+    parent_list = _XP_MULTIINSTANCE_PARENT(resource_element)
+    clone = parent_list[0] if parent_list else None
     if clone is None:
-        return resource_element.attrib["id"]
+        return resource_id
 
     report_msg = reports.messages.ResourceForConstraintIsMultiinstance(
-        resource_element.attrib["id"],
-        "clone" if clone.tag == "master" else clone.tag,
-        clone.attrib["id"],
+        resource_id,
+        _REPORTED_PARENT_TYPE.get(clone.tag, clone.tag),
+        clone.get("id"),
     )
     if in_clone_allowed:
         if report_processor.report(ReportItem.warning(report_msg)).has_errors:
             raise LibraryError()
-        return resource_element.attrib["id"]
+        return resource_id
 
     raise LibraryError(
         ReportItem.error(
@@ -69,20 +79,17 @@ def find_valid_resource_id(
 
 def prepare_options(attrib_names, options, create_id_fn, validate_id):
     _validate_attrib_names(attrib_names + ("id",), options)
-    options = options.copy()
-
-    if "id" not in options:
-        options["id"] = create_id_fn()
-    else:
+    if "id" in options:
         validate_id(options["id"])
-    return options
+        return dict(options)
+    return {**options, "id": create_id_fn()}
 
 
 def export_with_set(element):
     return {
         "resource_sets": [
             resource_set.export(resource_set_item)
-            for resource_set_item in element.findall(".//resource_set")
+            for resource_set_item in element.iterchildren("resource_set")
         ],
         "options": export_attributes(element),
     }
@@ -100,19 +107,24 @@ def create_id(cib, type_prefix, resource_set_list):
     # or more resources in a set constraint). Also, if a resource is deleted
     # and therefore removed from the constraint, the id no longer matches the
     # constraint.
-    resource_ids = []
-    for _set in resource_set_list:
-        resource_ids.extend(_set["ids"])
-    id_part = "".join([_id[0] + _id[-1] for _id in resource_ids][:3])
-    return find_unique_id(cib, "{0}_set_{1}".format(type_prefix, id_part))
+    resource_ids = chain.from_iterable(
+        _set["ids"] for _set in resource_set_list
+    )
+    id_part = "".join(_id[0] + _id[-1] for _id in islice(resource_ids, 3))
+    return find_unique_id(cib, f"{type_prefix}_set_{id_part}")
+
+
+def _get_resource_id_set_list(element):
+    return tuple(
+        tuple(resource_set.get_resource_id_set_list(resource_set_item))
+        for resource_set_item in element.iterchildren("resource_set")
+    )
 
 
 def have_duplicate_resource_sets(element, other_element):
-    get_id_set_list = lambda element: [
-        resource_set.get_resource_id_set_list(resource_set_item)
-        for resource_set_item in element.findall(".//resource_set")
-    ]
-    return get_id_set_list(element) == get_id_set_list(other_element)
+    return _get_resource_id_set_list(element) == _get_resource_id_set_list(
+        other_element
+    )
 
 
 def check_is_without_duplication(
@@ -125,7 +137,7 @@ def check_is_without_duplication(
 ):
     duplicate_element_list = [
         duplicate_element
-        for duplicate_element in constraint_section.findall(".//" + element.tag)
+        for duplicate_element in constraint_section.iterchildren(element.tag)
         if (
             element is not duplicate_element
             and are_duplicate(element, duplicate_element)
@@ -167,8 +179,8 @@ def create_with_set(constraint_section, tag_name, options, resource_set_list):
         raise LibraryError(
             ReportItem.error(reports.messages.EmptyResourceSetList())
         )
-    element = etree.SubElement(constraint_section, tag_name)
-    element.attrib.update(options)
+    element = etree.SubElement(constraint_section, tag_name, attrib=options)
+    id_provider = IdProvider(constraint_section)
     for resource_set_item in resource_set_list:
-        resource_set.create(element, resource_set_item)
+        resource_set.create(element, resource_set_item, id_provider)
     return element
@@ -2,7 +2,6 @@ from lxml import etree
 
 from pcs.common import reports
 from pcs.common.reports.item import ReportItem
-from pcs.lib.cib.tools import find_unique_id
 from pcs.lib.errors import LibraryError
 from pcs.lib.pacemaker.values import RESOURCE_ROLES
 from pcs.lib.xml_tools import export_attributes
@@ -46,15 +45,16 @@ def validate_options(options):
             )
 
 
-def create(parent, resource_set):
+def create(parent, resource_set, id_provider):
     """
     parent - lxml element for append new resource_set
+    IdProvider id_provider -- allocates the new id, allows to skip ids booked
+        for previously created resource sets without searching the cib again
     """
     element = etree.SubElement(parent, "resource_set")
     element.attrib.update(resource_set["options"])
-    element.attrib["id"] = find_unique_id(
-        parent.getroottree(),
-        "{0}_set".format(parent.attrib.get("id", "constraint_set")),
+    element.attrib["id"] = id_provider.allocate_id(
+        "{0}_set".format(parent.attrib.get("id", "constraint_set"))
     )
 
     for _id in resource_set["ids"]:
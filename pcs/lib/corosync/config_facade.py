@@ -638,10 +638,10 @@ class ConfigFacade(FacadeInterface):
 
     def is_quorum_device_heuristics_enabled_with_no_exec(self):
         heuristics_options = self.get_quorum_device_settings()[3]
-        regexp = constants.QUORUM_DEVICE_HEURISTICS_EXEC_NAME_RE
+        is_exec_name = constants.QUORUM_DEVICE_HEURISTICS_EXEC_NAME_RE.match
         exec_found = False
         for name, value in heuristics_options.items():
-            if value and regexp.match(name):
+            if value and is_exec_name(name):
                 exec_found = True
                 break
         return not exec_found and heuristics_options.get("mode") in (
@@ -1,6 +1,7 @@
 # pylint: disable=too-many-lines
 from collections import Counter, defaultdict, namedtuple
-from itertools import zip_longest
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from typing import (
     List,
     Mapping,
@@ -24,6 +25,25 @@ from pcs.lib.corosync.node import (
     get_address_type,
 )
 
+_RESOLVE_MAX_WORKERS = 32
+_LINK_OPTIONS_KNET_USER_WITHOUT_LINKNUMBER = tuple(
+    option
+    for option in constants.LINK_OPTIONS_KNET_USER
+    if option != "linknumber"
+)
+_QDEVICE_GENERIC_OPTIONS = (
+    "sync_timeout",
+    "timeout",
+)
+_QDEVICE_HEURISTICS_NONEXEC_OPTIONS = frozenset(
+    (
+        "interval",
+        "mode",
+        "sync_timeout",
+        "timeout",
+    )
+)
+_QDEVICE_NET_ALGORITHMS = ("ffsplit", "lms")
 _QDEVICE_NET_REQUIRED_OPTIONS = (
     "algorithm",
     "host",
@@ -34,6 +54,9 @@ _QDEVICE_NET_OPTIONAL_OPTIONS = (
     "port",
     "tie_breaker",
 )
+_QDEVICE_NET_OPTIONS = (
+    _QDEVICE_NET_REQUIRED_OPTIONS + _QDEVICE_NET_OPTIONAL_OPTIONS
+)
 
 
 class _LinkAddrType(namedtuple("_LinkAddrType", "link addr_type")):
@@ -124,29 +147,36 @@ def create(
     )
 
     # nodelist validation
-    get_addr_type = _addr_type_analyzer()
+    get_addr_type = _addr_type_analyzer(node_list)
     all_names_usable = True  # can names be used to identifying nodes?
-    all_names_count = defaultdict(int)
-    all_addrs_count = defaultdict(int)
-    addr_types_per_node = []
+    seen_names, non_unique_names = set(), set()
+    seen_addrs, non_unique_addrs = set(), set()
+    # indexes of links with IPv4 / IPv6 addresses
+    ipv4_links, ipv6_links = set(), set()
     unresolvable_addresses = set()
     nodes_with_empty_addr = set()
+    node_addr_count = {}
     # First, validate each node on its own. Also extract some info which will
     # be needed when validating the nodelist and inter-node dependencies.
     for i, node in enumerate(node_list, 1):
         report_items.extend(
             validate.ValidatorAll(_get_node_name_validators(i)).validate(node)
         )
+        # Cannot use node.get("addrs", []) - if node["addrs"] == None then
+        # the get returns None and len(None) raises an exception.
+        addrs = node.get("addrs") or ()
+        addr_count = len(addrs)
         if "name" in node and node["name"]:
-            # Count occurrences of each node name. Do not bother counting
-            # missing or empty names. They must be fixed anyway.
-            all_names_count[node["name"]] += 1
+            # Collect duplicate node names. Do not bother checking missing or
+            # empty names. They must be fixed anyway.
+            if node["name"] in seen_names:
+                non_unique_names.add(node["name"])
+            else:
+                seen_names.add(node["name"])
+            node_addr_count[node["name"]] = addr_count
         else:
             all_names_usable = False
-        # Cannot use node.get("addrs", []) - if node["addrs"] == None then
-        # the get returns None and len(None) raises an exception.
-        addr_count = len(node.get("addrs") or [])
-        if transport in constants.TRANSPORTS_KNET + constants.TRANSPORTS_UDP:
+        if transport in constants.TRANSPORTS_ALL:
             if transport in constants.TRANSPORTS_KNET:
                 min_addr_count = constants.LINKS_KNET_MIN
                 max_addr_count = constants.LINKS_KNET_MAX
@@ -166,16 +196,17 @@ def create(
                     )
                 )
         addr_types = []
-        # Cannot use node.get("addrs", []) - if node["addrs"] == None then
-        # the get returns None and len(None) raises an exception.
-        for link_index, addr in enumerate(node.get("addrs") or []):
+        for link_index, addr in enumerate(addrs):
             if addr == "":
                 if node.get("name"):
                     # No way to report name if none is set. Unnamed nodes cause
                     # errors anyway.
                     nodes_with_empty_addr.add(node.get("name"))
                 continue
-            all_addrs_count[addr] += 1
+            if addr in seen_addrs:
+                non_unique_addrs.add(addr)
+            else:
+                seen_addrs.add(addr)
             _validate_addr_type(
                 addr,
                 link_index,
@@ -186,7 +217,7 @@ def create(
                 unresolvable_addresses,
                 report_items,
             )
-        addr_types_per_node.append(addr_types)
+        _update_ip_version_links(addr_types, ipv4_links, ipv6_links)
     # Report all empty and unresolvable addresses at once instead on each own.
     if nodes_with_empty_addr:
         report_items.append(
@@ -206,9 +237,6 @@ def create(
         report_items.append(
             ReportItem.error(reports.messages.CorosyncNodesMissing())
         )
-    non_unique_names = {
-        name for name, count in all_names_count.items() if count > 1
-    }
     if non_unique_names:
         all_names_usable = False
         report_items.append(
@@ -216,13 +244,8 @@ def create(
                 reports.messages.NodeNamesDuplication(sorted(non_unique_names))
             )
         )
-    non_unique_addrs = {
-        addr
-        for addr, count in all_addrs_count.items()
-        # empty strings are not valid addresses and they are reported
-        # from a different piece of code in a different report
-        if count > 1 and addr != ""
-    }
+    # empty strings are not valid addresses and they are reported from
+    # a different piece of code in a different report, they are skipped above
     if non_unique_addrs:
         report_items.append(
             ReportItem.error(
@@ -235,17 +258,12 @@ def create(
         # Check for errors using node names in their reports. If node names are
         # ambiguous then such issues cannot be comprehensibly reported so the
         # checks are skipped.
-        node_addr_count = {}
-        for node in node_list:
-            # Cannot use node.get("addrs", []) - if node["addrs"] == None then
-            # the get returns None and len(None) raises an exception.
-            node_addr_count[node["name"]] = len(node.get("addrs") or [])
         # Check if all nodes have the same number of addresses. No need to
         # check that if udp or udpu transport is used as they can only use one
         # address and that has already been checked above.
         if (
             transport not in constants.TRANSPORTS_UDP
-            and len(Counter(node_addr_count.values()).keys()) > 1
+            and len(set(node_addr_count.values())) > 1
         ):
             report_items.append(
                 ReportItem.error(
@@ -255,10 +273,7 @@ def create(
                 )
             )
     # Check mixing IPv4 and IPv6 in one link, node names are not relevant
-    links_ip_mismatch = []
-    for link, addr_types in enumerate(zip_longest(*addr_types_per_node)):
-        if ADDR_IPV4 in addr_types and ADDR_IPV6 in addr_types:
-            links_ip_mismatch.append(link)
+    links_ip_mismatch = sorted(ipv4_links & ipv6_links)
     if links_ip_mismatch:
         report_items.append(
             ReportItem.error(
@@ -271,6 +286,21 @@ def create(
     return report_items
 
 
+def _update_ip_version_links(addr_types, ipv4_links, ipv6_links):
+    """
+    Record which links of a node have an IPv4 or an IPv6 address
+
+    list addr_types -- types of addresses of a node in order of links
+    set ipv4_links -- indexes of links with an IPv4 address, gets updated
+    set ipv6_links -- indexes of links with an IPv6 address, gets updated
+    """
+    for link_index, addr_type in enumerate(addr_types):
+        if addr_type == ADDR_IPV4:
+            ipv4_links.add(link_index)
+        elif addr_type == ADDR_IPV6:
+            ipv6_links.add(link_index)
+
+
 def _get_node_name_validators(node_index):
     _type = f"node {node_index}"
     _name = f"node {node_index} name"
@@ -282,9 +312,46 @@ def _get_node_name_validators(node_index):
     ]
 
 
-def _addr_type_analyzer():
+def _addr_type_analyzer(node_list=()):
+    """
+    Return a function providing a type of an address, resolve each address once
+
+    iterable node_list -- nodes (dict: name, addrs) whose hostname addresses
+        are resolved in parallel in advance
+    """
     cache = dict()
 
+    # Classify IP literals right away, only hostnames need to be resolved.
+    # Cannot use node.get("addrs", []) - if node["addrs"] == None then the get
+    # returns None and iterating None raises an exception.
+    hostname_list = []
+    hostname_set = set()
+    for node in node_list:
+        for addr in node.get("addrs") or []:
+            if not addr or addr in cache or addr in hostname_set:
+                continue
+            addr_type = get_address_type(addr)
+            if addr_type == ADDR_FQDN:
+                # hostnames get into the cache only once resolved
+                hostname_set.add(addr)
+                hostname_list.append(addr)
+            else:
+                cache[addr] = addr_type
+    # Resolving hostnames is slow, do not wait for them one by one. The
+    # executor raises errors of the lookups here.
+    if hostname_list:
+        with ThreadPoolExecutor(
+            max_workers=min(_RESOLVE_MAX_WORKERS, len(hostname_list))
+        ) as executor:
+            cache.update(
+                zip(
+                    hostname_list,
+                    executor.map(
+                        partial(get_address_type, resolve=True), hostname_list
+                    ),
+                )
+            )
+
     def analyzer(addr):
         if addr not in cache:
             cache[addr] = get_address_type(addr, resolve=True)
@@ -326,13 +393,11 @@ def _validate_addr_type(
     unresolvable_addresses,
     report_items,
 ):
-    addr_types.append(get_addr_type(addr))
-    if get_addr_type(addr) == ADDR_UNRESOLVABLE:
+    addr_type = get_addr_type(addr)
+    addr_types.append(addr_type)
+    if addr_type == ADDR_UNRESOLVABLE:
         unresolvable_addresses.add(addr)
-    elif (
-        get_addr_type(addr) == ADDR_IPV4
-        and ip_version == constants.IP_VERSION_6
-    ):
+    elif addr_type == ADDR_IPV4 and ip_version == constants.IP_VERSION_6:
         report_items.append(
             ReportItem.error(
                 reports.messages.CorosyncAddressIpVersionWrongForLink(
@@ -342,10 +407,7 @@ def _validate_addr_type(
                 )
             )
         )
-    elif (
-        get_addr_type(addr) == ADDR_IPV6
-        and ip_version == constants.IP_VERSION_4
-    ):
+    elif addr_type == ADDR_IPV6 and ip_version == constants.IP_VERSION_4:
         report_items.append(
             ReportItem.error(
                 reports.messages.CorosyncAddressIpVersionWrongForLink(
@@ -411,11 +473,12 @@ def add_nodes(
     number_of_existing_links = len(existing_addr_types)
 
     # validation
-    get_addr_type = _addr_type_analyzer()
+    get_addr_type = _addr_type_analyzer(node_list)
     report_items = []
     new_names_count = defaultdict(int)
     new_addrs_count = defaultdict(int)
-    new_addr_types_per_node = []
+    # indexes of links with IPv4 / IPv6 addresses
+    new_ipv4_links, new_ipv6_links = set(), set()
     links_ip_mismatch_reported = set()
     unresolvable_addresses = set()
     nodes_with_empty_addr = set()
@@ -432,7 +495,8 @@ def add_nodes(
             new_names_count[node["name"]] += 1
         # Cannot use node.get("addrs", []) - if node["addrs"] == None then
         # the get returns None and len(None) raises an exception.
-        addr_count = len(node.get("addrs") or [])
+        addrs = node.get("addrs") or ()
+        addr_count = len(addrs)
         if addr_count != number_of_existing_links:
             report_items.append(
                 ReportItem.error(
@@ -446,9 +510,7 @@ def add_nodes(
                 )
             )
         addr_types = []
-        # Cannot use node.get("addrs", []) - if node["addrs"] == None then
-        # the get returns None and len(None) raises an exception.
-        for link_index, addr in enumerate(node.get("addrs") or []):
+        for link_index, addr in enumerate(addrs):
             if addr == "":
                 if node.get("name"):
                     # No way to report name if none is set. Unnamed nodes cause
@@ -456,18 +518,18 @@ def add_nodes(
                     nodes_with_empty_addr.add(node.get("name"))
                 continue
             new_addrs_count[addr] += 1
-            addr_types.append(get_addr_type(addr))
-            if get_addr_type(addr) == ADDR_UNRESOLVABLE:
+            addr_type = get_addr_type(addr)
+            addr_types.append(addr_type)
+            if addr_type == ADDR_UNRESOLVABLE:
                 unresolvable_addresses.add(addr)
             # Check matching IPv4 / IPv6 in existing links. FQDN matches with
             # both IPv4 and IPv6 as it can resolve to both. Unresolvable is a
             # special case of FQDN so we don't need to check it.
             if (
                 link_index < number_of_existing_links
-                and get_addr_type(addr) not in (ADDR_FQDN, ADDR_UNRESOLVABLE)
+                and addr_type not in (ADDR_FQDN, ADDR_UNRESOLVABLE)
                 and existing_addr_types[link_index].addr_type != ADDR_FQDN
-                and get_addr_type(addr)
-                != existing_addr_types[link_index].addr_type
+                and addr_type != existing_addr_types[link_index].addr_type
             ):
                 links_ip_mismatch_reported.add(
                     existing_addr_types[link_index].link
@@ -485,7 +547,7 @@ def add_nodes(
                 "addr", option_name_for_report="node address"
             ).validate({"addr": addr})
 
-        new_addr_types_per_node.append(addr_types)
+        _update_ip_version_links(addr_types, new_ipv4_links, new_ipv6_links)
     # Report all empty and unresolvable addresses at once instead on each own.
     if nodes_with_empty_addr:
         report_items.append(
@@ -506,7 +568,7 @@ def add_nodes(
             ReportItem.error(reports.messages.CorosyncNodesMissing())
         )
     # Check nodes' names and address are unique
-    already_existing_names = existing_names.intersection(new_names_count.keys())
+    already_existing_names = existing_names.intersection(new_names_count)
     if already_existing_names:
         report_items.append(
             ReportItem.error(
@@ -515,7 +577,7 @@ def add_nodes(
                 )
             )
         )
-    already_existing_addrs = existing_addrs.intersection(new_addrs_count.keys())
+    already_existing_addrs = existing_addrs.intersection(new_addrs_count)
     if already_existing_addrs:
         report_items.append(
             ReportItem.error(
@@ -547,16 +609,11 @@ def add_nodes(
     # Check mixing IPv4 and IPv6 in one link, node names are not relevant,
     # skip links already reported due to new nodes have wrong IP version
     existing_links = [x.link for x in existing_addr_types]
-    links_ip_mismatch = []
-    for link_index, addr_types in enumerate(
-        zip_longest(*new_addr_types_per_node)
-    ):
-        if (
-            ADDR_IPV4 in addr_types
-            and ADDR_IPV6 in addr_types
-            and existing_links[link_index] not in links_ip_mismatch_reported
-        ):
-            links_ip_mismatch.append(existing_links[link_index])
+    links_ip_mismatch = [
+        existing_links[link_index]
+        for link_index in sorted(new_ipv4_links & new_ipv6_links)
+        if existing_links[link_index] not in links_ip_mismatch_reported
+    ]
     if links_ip_mismatch:
         report_items.append(
             ReportItem.error(
@@ -726,10 +783,15 @@ def create_link_list_knet(link_list, max_allowed_link_count):
         return []
 
     report_items = []
-    used_link_number = defaultdict(int)
+    # dict keeps the link numbers in order of their first use
+    used_link_number = dict()
+    duplicate_link_number = set()
     for options in link_list:
         if "linknumber" in options:
-            used_link_number[options["linknumber"]] += 1
+            if options["linknumber"] in used_link_number:
+                duplicate_link_number.add(options["linknumber"])
+            else:
+                used_link_number[options["linknumber"]] = True
             if validate.is_integer(
                 options["linknumber"], 0, constants.LINKS_KNET_MAX - 1
             ):
@@ -747,14 +809,15 @@ def create_link_list_knet(link_list, max_allowed_link_count):
                         )
                     )
         report_items += _add_link_options_knet(options)
-    non_unique_linknumbers = [
-        number for number, count in used_link_number.items() if count > 1
-    ]
-    if non_unique_linknumbers:
+    if duplicate_link_number:
         report_items.append(
             ReportItem.error(
                 reports.messages.CorosyncLinkNumberDuplication(
-                    non_unique_linknumbers,
+                    [
+                        number
+                        for number in used_link_number
+                        if number in duplicate_link_number
+                    ],
                 )
             )
         )
@@ -787,11 +850,7 @@ def _get_link_options_validators_knet(
         )
         allowed_options = constants.LINK_OPTIONS_KNET_USER
     else:
-        allowed_options = [
-            option
-            for option in constants.LINK_OPTIONS_KNET_USER
-            if option != "linknumber"
-        ]
+        allowed_options = _LINK_OPTIONS_KNET_USER_WITHOUT_LINKNUMBER
 
     if allow_empty_values:
         for val in validators:
@@ -927,11 +986,11 @@ def add_link(
                 node_name=node,
             )
         )
-        for node in sorted(existing_names - set(node_addr_map.keys()))
+        for node in sorted(existing_names - set(node_addr_map))
     ]
     report_items += [
         ReportItem.error(reports.messages.NodeNotFound(node))
-        for node in sorted(set(node_addr_map.keys()) - existing_names)
+        for node in sorted(set(node_addr_map) - existing_names)
     ]
 
     get_addr_type = _addr_type_analyzer()
@@ -1141,7 +1200,7 @@ def update_link(
     # report unknown nodes
     report_items += [
         ReportItem.error(reports.messages.NodeNotFound(node))
-        for node in sorted(set(node_addr_map.keys()) - existing_names)
+        for node in sorted(set(node_addr_map) - existing_names)
     ]
     # validate new addresses
     unresolvable_addresses = set()
@@ -1258,11 +1317,14 @@ def _validate_transport_udp(
     crypto_options: Mapping[str, str],
     allow_empty_values: bool,
 ) -> ReportItemList:
-    report_items = validate.ValidatorAll(
-        _get_transport_udp_generic_validators(
-            generic_options, allow_empty_values=allow_empty_values
-        )
-    ).validate(generic_options)
+    report_items = []
+    # No options are required, so there is nothing to check in empty ones
+    if generic_options:
+        report_items = validate.ValidatorAll(
+            _get_transport_udp_generic_validators(
+                generic_options, allow_empty_values=allow_empty_values
+            )
+        ).validate(generic_options)
 
     if compression_options:
         report_items.append(
@@ -1422,26 +1484,22 @@ def _validate_transport_knet(
     #   setting they should not to
     # * changes to names and values in corosync are very rare
 
-    generic_validators = _get_transport_knet_generic_validators(
-        generic_options,
-        allow_empty_values=allow_empty_values,
-    )
-    crypto_validators = _get_transport_knet_crypto_validators(
-        crypto_options,
-        allow_empty_values=allow_empty_values,
-    )
-    compression_validators = _get_transport_knet_compression_validators(
-        compression_options,
-        allow_empty_values=allow_empty_values,
-    )
-
-    return (
-        validate.ValidatorAll(generic_validators).validate(generic_options)
-        + validate.ValidatorAll(compression_validators).validate(
-            compression_options
-        )
-        + validate.ValidatorAll(crypto_validators).validate(crypto_options)
-    )
+    # No options are required, so there is nothing to check in empty ones
+    report_items = []
+    for options, get_validators in (
+        (generic_options, _get_transport_knet_generic_validators),
+        (compression_options, _get_transport_knet_compression_validators),
+        (crypto_options, _get_transport_knet_crypto_validators),
+    ):
+        if options:
+            report_items.extend(
+                validate.ValidatorAll(
+                    get_validators(
+                        options, allow_empty_values=allow_empty_values
+                    )
+                ).validate(options)
+            )
+    return report_items
 
 
 def create_transport_knet(
@@ -1546,24 +1604,12 @@ def _get_totem_options_validators(
     # * names are strictly set as we cannot risk the user overwrites some
     #   setting they should not to
     # * changes to names and values in corosync are very rare
+    # All totem options are nonnegative integers. Only the options being set
+    # need a validator.
     validators = [
-        validate.ValueNonnegativeInteger("consensus"),
-        validate.ValueNonnegativeInteger("downcheck"),
-        validate.ValueNonnegativeInteger("fail_recv_const"),
-        validate.ValueNonnegativeInteger("heartbeat_failures_allowed"),
-        validate.ValueNonnegativeInteger("hold"),
-        validate.ValueNonnegativeInteger("join"),
-        validate.ValueNonnegativeInteger("max_messages"),
-        validate.ValueNonnegativeInteger("max_network_delay"),
-        validate.ValueNonnegativeInteger("merge"),
-        validate.ValueNonnegativeInteger("miss_count_const"),
-        validate.ValueNonnegativeInteger("send_join"),
-        validate.ValueNonnegativeInteger("seqno_unchanged_const"),
-        validate.ValueNonnegativeInteger("token"),
-        validate.ValueNonnegativeInteger("token_coefficient"),
-        validate.ValueNonnegativeInteger("token_retransmit"),
-        validate.ValueNonnegativeInteger("token_retransmits_before_loss_const"),
-        validate.ValueNonnegativeInteger("window_size"),
+        validate.ValueNonnegativeInteger(name)
+        for name in constants.TOTEM_OPTIONS
+        if name in options
     ]
     if allow_empty_values:
         for val in validators:
@@ -1580,6 +1626,9 @@ def _get_totem_options_validators(
 def _validate_totem_options(
     options: Mapping[str, str], allow_empty_values: bool
 ) -> ReportItemList:
+    # No totem options are required, so there is nothing to check
+    if not options:
+        return []
     return validate.ValidatorAll(
         _get_totem_options_validators(
             options, allow_empty_values=allow_empty_values
@@ -1682,6 +1731,9 @@ def update_quorum_options(options, has_qdevice, current_options):
 
 
 def _validate_quorum_options(options, has_qdevice, allow_empty_values):
+    # No quorum options are required, so there is nothing to check
+    if not options:
+        return []
     report_items = validate.ValidatorAll(
         _get_quorum_options_validators(
             options, allow_empty_values=allow_empty_values
@@ -1754,13 +1806,13 @@ def add_quorum_device(
         ),
     }
     if model in model_validators:
-        model_report_items = model_validators[model]()
+        report_items = model_validators[model]()
     else:
-        model_report_items = validate.ValidatorAll(
+        report_items = validate.ValidatorAll(
             [
                 validate.ValueIn(
                     "model",
-                    list(model_validators.keys()),
+                    list(model_validators),
                     severity=reports.item.get_severity(
                         reports.codes.FORCE_QDEVICE_MODEL, force_model
                     ),
@@ -1769,20 +1821,24 @@ def add_quorum_device(
             ]
         ).validate({"model": model})
 
-    return (
-        model_report_items
-        + validate.ValidatorAll(
+    report_items.extend(
+        validate.ValidatorAll(
             _get_unsuitable_keys_and_values_validators(
                 model_options, "quorum device model"
             )
         ).validate(model_options)
-        + validate.ValidatorAll(
+    )
+    report_items.extend(
+        validate.ValidatorAll(
             _get_qdevice_generic_options_validators(
                 generic_options, force_options=force_options
             )
         ).validate(generic_options)
-        + _qdevice_add_heuristics_options(heuristics_options, force_options)
     )
+    report_items.extend(
+        _qdevice_add_heuristics_options(heuristics_options, force_options)
+    )
+    return report_items
 
 
 def update_quorum_device(
@@ -1809,26 +1865,30 @@ def update_quorum_device(
         ),
     }
     if model in model_validators:
-        model_report_items = model_validators[model]()
+        report_items = model_validators[model]()
     else:
-        model_report_items = []
+        report_items = []
 
-    return (
-        model_report_items
-        + validate.ValidatorAll(
+    report_items.extend(
+        validate.ValidatorAll(
             _get_unsuitable_keys_and_values_validators(
                 model_options, "quorum device model"
             )
         ).validate(model_options)
-        + validate.ValidatorAll(
+    )
+    report_items.extend(
+        validate.ValidatorAll(
             _get_qdevice_generic_options_validators(
                 generic_options,
                 allow_empty_values=True,
                 force_options=force_options,
             )
         ).validate(generic_options)
-        + _qdevice_update_heuristics_options(heuristics_options, force_options)
     )
+    report_items.extend(
+        _qdevice_update_heuristics_options(heuristics_options, force_options)
+    )
+    return report_items
 
 
 def _qdevice_add_heuristics_options(options, force_options=False):
@@ -1838,6 +1898,9 @@ def _qdevice_add_heuristics_options(options, force_options=False):
     dict options -- heuristics options
     bool force_options -- turn forceable errors into warnings
     """
+    # Heuristics are often not configured at all, nothing to check then
+    if not options:
+        return []
     options_nonexec, options_exec = _split_heuristics_exec_options(options)
     validators_nonexec = _get_qdevice_heuristics_nonexec_options_validators(
         force_options=force_options
@@ -1846,13 +1909,16 @@ def _qdevice_add_heuristics_options(options, force_options=False):
         validate.ValueNotEmpty(option, "a command to be run")
         for option in options_exec
     ]
-    return (
-        validate.ValidatorAll(
-            _get_unsuitable_keys_and_values_validators(options, "heuristics")
-        ).validate(options)
-        + validate.ValidatorAll(validators_nonexec).validate(options_nonexec)
-        + validate.ValidatorAll(validators_exec).validate(options_exec)
+    report_items = validate.ValidatorAll(
+        _get_unsuitable_keys_and_values_validators(options, "heuristics")
+    ).validate(options)
+    report_items.extend(
+        validate.ValidatorAll(validators_nonexec).validate(options_nonexec)
     )
+    report_items.extend(
+        validate.ValidatorAll(validators_exec).validate(options_exec)
+    )
+    return report_items
 
 
 def _qdevice_update_heuristics_options(options, force_options=False):
@@ -1862,6 +1928,9 @@ def _qdevice_update_heuristics_options(options, force_options=False):
     dict options -- heuristics options
     bool force_options -- turn forceable errors into warnings
     """
+    # Heuristics are often not being updated at all, nothing to check then
+    if not options:
+        return []
     options_nonexec, dummy_options_exec = _split_heuristics_exec_options(
         options
     )
@@ -1870,11 +1939,13 @@ def _qdevice_update_heuristics_options(options, force_options=False):
     )
     # No validation necessary for values of exec options - they are either
     # empty (meaning they will be removed) or nonempty strings.
-    return validate.ValidatorAll(
+    report_items = validate.ValidatorAll(
         _get_unsuitable_keys_and_values_validators(options, "heuristics")
-    ).validate(options) + validate.ValidatorAll(validators_nonexec).validate(
-        options_nonexec
+    ).validate(options)
+    report_items.extend(
+        validate.ValidatorAll(validators_nonexec).validate(options_nonexec)
     )
+    return report_items
 
 
 def _qdevice_add_model_net_options(options, node_ids, force_options=False):
@@ -1930,7 +2001,7 @@ def _get_qdevice_generic_options_validators(
     return (
         [
             validate.NamesIn(
-                ["sync_timeout", "timeout"],
+                _QDEVICE_GENERIC_OPTIONS,
                 option_type="quorum device",
                 banned_name_list=["model"],
                 severity=severity,
@@ -1959,12 +2030,6 @@ def _get_qdevice_heuristics_nonexec_options_validators(
         reports.codes.FORCE_OPTIONS, force_options
     )
 
-    allowed_options = [
-        "interval",
-        "mode",
-        "sync_timeout",
-        "timeout",
-    ]
     validators = [
         validate.ValueIn("mode", ("off", "on", "sync"), severity=severity),
         validate.ValuePositiveInteger("interval", severity=severity),
@@ -1977,7 +2042,7 @@ def _get_qdevice_heuristics_nonexec_options_validators(
             val.empty_string_valid = True
     return [
         validate.NamesIn(
-            allowed_options,
+            _QDEVICE_HEURISTICS_NONEXEC_OPTIONS,
             allowed_option_patterns=["exec_NAME"],
             option_type="heuristics",
             severity=severity,
@@ -1991,14 +2056,12 @@ def _get_qdevice_model_net_options_validators(
     severity = reports.item.get_severity(
         reports.codes.FORCE_OPTIONS, force_options
     )
-    allowed_algorithms = ("ffsplit", "lms")
-
     validators_required_options = [
         validate.ValidatorFirstError(
             [
-                validate.ValueNotEmpty("algorithm", allowed_algorithms),
+                validate.ValueNotEmpty("algorithm", _QDEVICE_NET_ALGORITHMS),
                 validate.ValueIn(
-                    "algorithm", allowed_algorithms, severity=severity
+                    "algorithm", _QDEVICE_NET_ALGORITHMS, severity=severity
                 ),
             ]
         ),
@@ -2023,7 +2086,7 @@ def _get_qdevice_model_net_options_validators(
     return (
         [
             validate.NamesIn(
-                _QDEVICE_NET_REQUIRED_OPTIONS + _QDEVICE_NET_OPTIONAL_OPTIONS,
+                _QDEVICE_NET_OPTIONS,
                 option_type="quorum device model",
                 severity=severity,
             )
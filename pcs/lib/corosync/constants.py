@@ -105,10 +105,12 @@ QUORUM_OPTIONS = (
     "wait_for_all",
 )
 
-QUORUM_OPTIONS_INCOMPATIBLE_WITH_QDEVICE = (
-    "auto_tie_breaker",
-    "last_man_standing",
-    "last_man_standing_window",
+QUORUM_OPTIONS_INCOMPATIBLE_WITH_QDEVICE = frozenset(
+    (
+        "auto_tie_breaker",
+        "last_man_standing",
+        "last_man_standing_window",
+    )
 )
 
 OPTION_NAME_RE = re.compile(r"^[-_/a-zA-Z0-9]+$")
@@ -1,10 +1,7 @@
 from collections import namedtuple
+import ipaddress
 import socket
 
-from pcs.lib.validate import (
-    is_ipv4_address,
-    is_ipv6_address,
-)
 from pcs.common.corosync_conf import (
     CorosyncNodeAddressDto,
     CorosyncNodeDto,
@@ -15,6 +12,8 @@ ADDR_IPV6 = "IPv6"
 ADDR_FQDN = "FQDN"
 ADDR_UNRESOLVABLE = "unresolvable"
 
+_ADDR_TYPE_BY_IP_VERSION = {4: ADDR_IPV4, 6: ADDR_IPV6}
+
 
 # TODO: add pcs.common.interface.dto.ImplementsToDto inheritance
 class CorosyncNodeAddress(namedtuple("CorosyncNodeAddress", "addr link")):
@@ -72,10 +71,16 @@ class CorosyncNode(namedtuple("CorosyncNode", "name addrs nodeid")):
 
 
 def get_address_type(address, resolve=False):
-    if is_ipv4_address(address):
-        return ADDR_IPV4
-    if is_ipv6_address(address):
-        return ADDR_IPV6
+    # ip_address accepts both strings and integers. Only a string
+    # representation of an IP is an IP address here. One parse tells both
+    # whether the address is an IP and its version.
+    if isinstance(address, str):
+        try:
+            return _ADDR_TYPE_BY_IP_VERSION[
+                ipaddress.ip_address(address).version
+            ]
+        except ValueError:
+            pass
     if resolve:
         try:
             socket.getaddrinfo(address, None)
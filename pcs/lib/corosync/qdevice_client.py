@@ -6,18 +6,17 @@ from pcs.common.reports.item import ReportItem
 from pcs.common.str_tools import join_multilines
 from pcs.lib.errors import LibraryError
 
+__qdevice_tool = os.path.join(
+    settings.corosync_binaries, "corosync-qdevice-tool"
+)
+
 
 def get_status_text(runner, verbose=False):
     """
     Get quorum device client runtime status in plain text
     bool verbose get more detailed output
     """
-    cmd = [
-        os.path.join(settings.corosync_binaries, "corosync-qdevice-tool"),
-        "-s",
-    ]
-    if verbose:
-        cmd.append("-v")
+    cmd = [__qdevice_tool, "-s", "-v"] if verbose else [__qdevice_tool, "-s"]
     stdout, stderr, retval = runner.run(cmd)
     if retval != 0:
         raise LibraryError(
@@ -177,92 +177,66 @@ class OpDefaultsConfig(DefaultsConfigMixin, TestCase):
 
 
 class DefaultsSetCreateMixin(DefaultsBaseMixin):
-    def test_no_args(self):
-        self._call_cmd([])
-        self.lib_command.assert_called_once_with(
-            {}, {}, nvset_rule=None, force_flags=set()
-        )
-
-    def test_no_values(self):
-        self._call_cmd(["meta", "rule"])
-        self.lib_command.assert_called_once_with(
-            {}, {}, nvset_rule=None, force_flags=set()
-        )
-
-    def test_bad_options_or_keyword(self):
-        with self.assertRaises(CmdLineInputError) as cm:
-            self._call_cmd(["aaa"])
-        self.assertEqual(
-            cm.exception.message,
-            "missing value of 'aaa' option",
-        )
-        self.lib_command.assert_not_called()
-
-    def test_bad_values(self):
-        with self.assertRaises(CmdLineInputError) as cm:
-            self._call_cmd(["meta", "aaa"])
-        self.assertEqual(
-            cm.exception.message,
-            "missing value of 'aaa' option",
-        )
-        self.lib_command.assert_not_called()
-
-    def test_options(self):
-        self._call_cmd(["id=custom-id", "score=10"])
-        self.lib_command.assert_called_once_with(
-            {},
-            {"id": "custom-id", "score": "10"},
-            nvset_rule=None,
-            force_flags=set(),
-        )
-
-    def test_nvpairs(self):
-        self._call_cmd(["meta", "name1=value1", "name2=value2"])
-        self.lib_command.assert_called_once_with(
-            {"name1": "value1", "name2": "value2"},
-            {},
-            nvset_rule=None,
-            force_flags=set(),
-        )
-
-    def test_rule(self):
-        self._call_cmd(["rule", "resource", "dummy", "or", "op", "monitor"])
-        self.lib_command.assert_called_once_with(
-            {},
-            {},
-            nvset_rule="resource dummy or op monitor",
-            force_flags=set(),
-        )
-
-    def test_force(self):
-        self._call_cmd([], {"force": True})
-        self.lib_command.assert_called_once_with(
-            {}, {}, nvset_rule=None, force_flags=set([report_codes.FORCE])
-        )
-
-    def test_all(self):
-        self._call_cmd(
-            [
-                "id=custom-id",
-                "score=10",
-                "meta",
-                "name1=value1",
-                "name2=value2",
-                "rule",
-                "resource",
-                "dummy",
-                "or",
-                "op",
-                "monitor",
-            ],
-            {"force": True},
-        )
-        self.lib_command.assert_called_once_with(
-            {"name1": "value1", "name2": "value2"},
-            {"id": "custom-id", "score": "10"},
-            nvset_rule="resource dummy or op monitor",
-            force_flags=set([report_codes.FORCE]),
-        )
+    def test_success(self):
+        rule_argv = ["rule", "resource", "dummy", "or", "op", "monitor"]
+        rule = "resource dummy or op monitor"
+        nvpairs = {"name1": "value1", "name2": "value2"}
+        options = {"id": "custom-id", "score": "10"}
+        force = {"force": True}
+        force_flags = {report_codes.FORCE}
+        for case in [
+            {"label": "no args"},
+            {"label": "no values", "argv": ["meta", "rule"]},
+            {
+                "label": "options",
+                "argv": ["id=custom-id", "score=10"],
+                "options": options,
+            },
+            {
+                "label": "nvpairs",
+                "argv": ["meta", "name1=value1", "name2=value2"],
+                "nvpairs": nvpairs,
+            },
+            {"label": "rule", "argv": rule_argv, "nvset_rule": rule},
+            {"label": "force", "modifiers": force, "force_flags": force_flags},
+            {
+                "label": "all",
+                "argv": [
+                    "id=custom-id",
+                    "score=10",
+                    "meta",
+                    "name1=value1",
+                    "name2=value2",
+                ]
+                + rule_argv,
+                "modifiers": force,
+                "nvpairs": nvpairs,
+                "options": options,
+                "nvset_rule": rule,
+                "force_flags": force_flags,
+            },
+        ]:
+            with self.subTest(case["label"]):
+                self.lib_command.reset_mock()
+                self._call_cmd(case.get("argv", []), case.get("modifiers"))
+                self.lib_command.assert_called_once_with(
+                    case.get("nvpairs", {}),
+                    case.get("options", {}),
+                    nvset_rule=case.get("nvset_rule"),
+                    force_flags=case.get("force_flags", set()),
+                )
+
+    def test_missing_value(self):
+        # a bad option or keyword, a bad nvpair
+        for argv in (["aaa"], ["meta", "aaa"]):
+            with self.subTest(argv=argv):
+                with self.assertRaises(CmdLineInputError) as cm:
+                    self._call_cmd(argv)
+                self.assertEqual(
+                    cm.exception.message,
+                    "missing value of 'aaa' option",
+                )
+                self.lib_command.assert_not_called()
 
 
 class RscDefaultsSetCreate(DefaultsSetCreateMixin, TestCase):
@@ -1,4 +1,3 @@
-from random import shuffle
 from textwrap import dedent
 from unittest import mock, TestCase
 
@@ -11,6 +10,96 @@ from pcs_test.tools.misc import dict_to_modifiers
 from pcs import resource
 from pcs.cli.common.errors import CmdLineInputError
 
+# InputModifiers cannot be changed once created, so it can be shared
+EMPTY_MODIFIERS = dict_to_modifiers({})
+RESOURCE_DISABLE_SPEC = ("disable", "disable_safe", "disable_simulate")
+
+FIXTURE_FAILURES_MONITOR = (
+    {
+        "node": "node2",
+        "resource": "resource",
+        "clone_id": None,
+        "operation": "monitor",
+        "interval": "500",
+        "fail_count": 10,
+        "last_failure": 1528871946,
+    },
+    {
+        "node": "node2",
+        "resource": "resource",
+        "clone_id": None,
+        "operation": "monitor",
+        "interval": "1500",
+        "fail_count": 150,
+        "last_failure": 1528871956,
+    },
+    {
+        "node": "node1",
+        "resource": "resource",
+        "clone_id": None,
+        "operation": "monitor",
+        "interval": "1500",
+        "fail_count": 25,
+        "last_failure": 1528871966,
+    },
+)
+FIXTURE_FAILURES_OTHER = (
+    {
+        "node": "node1",
+        "resource": "clone",
+        "clone_id": "0",
+        "operation": "start",
+        "interval": "0",
+        "fail_count": "INFINITY",
+        "last_failure": 1528871936,
+    },
+    {
+        "node": "node1",
+        "resource": "clone",
+        "clone_id": "1",
+        "operation": "start",
+        "interval": "0",
+        "fail_count": "INFINITY",
+        "last_failure": 1528871936,
+    },
+    {
+        "node": "node2",
+        "resource": "clone",
+        "clone_id": "0",
+        "operation": "start",
+        "interval": "0",
+        "fail_count": "INFINITY",
+        "last_failure": 1528871936,
+    },
+    {
+        "node": "node2",
+        "resource": "clone",
+        "clone_id": "1",
+        "operation": "start",
+        "interval": "0",
+        "fail_count": "INFINITY",
+        "last_failure": 1528871936,
+    },
+    {
+        "node": "node1",
+        "resource": "resource",
+        "clone_id": None,
+        "operation": "start",
+        "interval": "0",
+        "fail_count": 100,
+        "last_failure": 1528871966,
+    },
+    {
+        "node": "node1",
+        "resource": "resource",
+        "clone_id": None,
+        "operation": "start",
+        "interval": "0",
+        "fail_count": "INFINITY",
+        "last_failure": 1528871966,
+    },
+)
+
 
 class FailcountShow(TestCase):
     def setUp(self):
@@ -38,180 +127,62 @@ class FailcountShow(TestCase):
             expected_output,
         )
 
+    # Failures are provided in a fixed mixed-up order to make sure the output
+    # does not depend on the order of the data
     @staticmethod
     def fixture_failures_monitor():
-        failures = [
-            {
-                "node": "node2",
-                "resource": "resource",
-                "clone_id": None,
-                "operation": "monitor",
-                "interval": "500",
-                "fail_count": 10,
-                "last_failure": 1528871946,
-            },
-            {
-                "node": "node2",
-                "resource": "resource",
-                "clone_id": None,
-                "operation": "monitor",
-                "interval": "1500",
-                "fail_count": 150,
-                "last_failure": 1528871956,
-            },
-            {
-                "node": "node1",
-                "resource": "resource",
-                "clone_id": None,
-                "operation": "monitor",
-                "interval": "1500",
-                "fail_count": 25,
-                "last_failure": 1528871966,
-            },
-        ]
-        shuffle(failures)
-        return failures
-
-    def fixture_failures(self):
-        failures = self.fixture_failures_monitor() + [
-            {
-                "node": "node1",
-                "resource": "clone",
-                "clone_id": "0",
-                "operation": "start",
-                "interval": "0",
-                "fail_count": "INFINITY",
-                "last_failure": 1528871936,
-            },
-            {
-                "node": "node1",
-                "resource": "clone",
-                "clone_id": "1",
-                "operation": "start",
-                "interval": "0",
-                "fail_count": "INFINITY",
-                "last_failure": 1528871936,
-            },
-            {
-                "node": "node2",
-                "resource": "clone",
-                "clone_id": "0",
-                "operation": "start",
-                "interval": "0",
-                "fail_count": "INFINITY",
-                "last_failure": 1528871936,
-            },
-            {
-                "node": "node2",
-                "resource": "clone",
-                "clone_id": "1",
-                "operation": "start",
-                "interval": "0",
-                "fail_count": "INFINITY",
-                "last_failure": 1528871936,
-            },
-            {
-                "node": "node1",
-                "resource": "resource",
-                "clone_id": None,
-                "operation": "start",
-                "interval": "0",
-                "fail_count": 100,
-                "last_failure": 1528871966,
-            },
-            {
-                "node": "node1",
-                "resource": "resource",
-                "clone_id": None,
-                "operation": "start",
-                "interval": "0",
-                "fail_count": "INFINITY",
-                "last_failure": 1528871966,
-            },
-        ]
-        shuffle(failures)
-        return failures
-
-    def test_no_failcounts(self):
-        self.assert_failcount_output([], "No failcounts")
-
-    def test_no_failcounts_resource(self):
-        self.assert_failcount_output(
-            [], "No failcounts for resource 'res'", resource_id="res"
-        )
-
-    def test_no_failcounts_node(self):
-        self.assert_failcount_output(
-            [], "No failcounts on node 'nod'", node="nod"
-        )
-
-    def test_no_failcounts_operation(self):
-        self.assert_failcount_output(
-            [], "No failcounts for operation 'ope'", operation="ope"
-        )
-
-    def test_no_failcounts_operation_interval(self):
-        self.assert_failcount_output(
-            [],
-            "No failcounts for operation 'ope' with interval '10'",
-            operation="ope",
-            interval="10",
-        )
-
-    def test_no_failcounts_resource_node(self):
-        self.assert_failcount_output(
-            [],
-            "No failcounts for resource 'res' on node 'nod'",
-            resource_id="res",
-            node="nod",
-        )
-
-    def test_no_failcounts_resource_operation(self):
-        self.assert_failcount_output(
-            [],
-            "No failcounts for operation 'ope' of resource 'res'",
-            resource_id="res",
-            operation="ope",
-        )
-
-    def test_no_failcounts_resource_operation_interval(self):
-        self.assert_failcount_output(
-            [],
-            "No failcounts for operation 'ope' with interval '10' of resource "
-            "'res'",
-            resource_id="res",
-            operation="ope",
-            interval="10",
-        )
+        return [FIXTURE_FAILURES_MONITOR[i] for i in (2, 0, 1)]
 
-    def test_no_failcounts_resource_node_operation_interval(self):
-        self.assert_failcount_output(
-            [],
-            "No failcounts for operation 'ope' with interval '10' of resource "
-            "'res' on node 'nod'",
-            resource_id="res",
-            node="nod",
-            operation="ope",
-            interval="10",
-        )
-
-    def test_no_failcounts_node_operation(self):
-        self.assert_failcount_output(
-            [],
-            "No failcounts for operation 'ope' on node 'nod'",
-            node="nod",
-            operation="ope",
-        )
+    @staticmethod
+    def fixture_failures():
+        failures = FIXTURE_FAILURES_MONITOR + FIXTURE_FAILURES_OTHER
+        return [failures[i] for i in (5, 8, 2, 0, 7, 3, 1, 6, 4)]
 
-    def test_no_failcounts_node_operation_interval(self):
-        # pylint: disable=line-too-long
-        self.assert_failcount_output(
-            [],
-            "No failcounts for operation 'ope' with interval '10' on node 'nod'",
-            node="nod",
-            operation="ope",
-            interval="10",
-        )
+    def test_no_failcounts(self):
+        for filters, expected_output in [
+            ({}, "No failcounts"),
+            (dict(resource_id="res"), "No failcounts for resource 'res'"),
+            (dict(node="nod"), "No failcounts on node 'nod'"),
+            (dict(operation="ope"), "No failcounts for operation 'ope'"),
+            (
+                dict(operation="ope", interval="10"),
+                "No failcounts for operation 'ope' with interval '10'",
+            ),
+            (
+                dict(resource_id="res", node="nod"),
+                "No failcounts for resource 'res' on node 'nod'",
+            ),
+            (
+                dict(resource_id="res", operation="ope"),
+                "No failcounts for operation 'ope' of resource 'res'",
+            ),
+            (
+                dict(resource_id="res", operation="ope", interval="10"),
+                "No failcounts for operation 'ope' with interval '10' of "
+                "resource 'res'",
+            ),
+            (
+                dict(
+                    resource_id="res",
+                    node="nod",
+                    operation="ope",
+                    interval="10",
+                ),
+                "No failcounts for operation 'ope' with interval '10' of "
+                "resource 'res' on node 'nod'",
+            ),
+            (
+                dict(node="nod", operation="ope"),
+                "No failcounts for operation 'ope' on node 'nod'",
+            ),
+            (
+                dict(node="nod", operation="ope", interval="10"),
+                "No failcounts for operation 'ope' with interval '10' on node "
+                "'nod'",
+            ),
+        ]:
+            with self.subTest(**filters):
+                self.assert_failcount_output([], expected_output, **filters)
 
     def test_failcounts_short(self):
         self.assert_failcount_output(
@@ -287,17 +258,13 @@ class GroupAdd(TestCase, AssertPcsMixin):
 
     def test_no_args(self):
         with self.assertRaises(CmdLineInputError) as cm:
-            resource.resource_group_add_cmd(
-                self.lib, [], dict_to_modifiers(dict())
-            )
+            resource.resource_group_add_cmd(self.lib, [], EMPTY_MODIFIERS)
         self.assertIsNone(cm.exception.message)
         self.resource.group_add.assert_not_called()
 
     def test_no_resources(self):
         with self.assertRaises(CmdLineInputError) as cm:
-            resource.resource_group_add_cmd(
-                self.lib, ["G"], dict_to_modifiers(dict())
-            )
+            resource.resource_group_add_cmd(self.lib, ["G"], EMPTY_MODIFIERS)
         self.assertIsNone(cm.exception.message)
         self.resource.group_add.assert_not_called()
 
@@ -315,7 +282,7 @@ class GroupAdd(TestCase, AssertPcsMixin):
 
     def test_success(self):
         resource.resource_group_add_cmd(
-            self.lib, ["G", "R1", "R2"], dict_to_modifiers(dict())
+            self.lib, ["G", "R1", "R2"], EMPTY_MODIFIERS
         )
         self.resource.group_add.assert_called_once_with(
             "G",
@@ -365,7 +332,7 @@ class GroupAdd(TestCase, AssertPcsMixin):
 class ResourceMoveBanMixin:
     def test_no_args(self):
         with self.assertRaises(CmdLineInputError) as cm:
-            self.cli_command(self.lib, [], dict_to_modifiers(dict()))
+            self.cli_command(self.lib, [], EMPTY_MODIFIERS)
         self.assertEqual(cm.exception.message, self.no_args_error)
         self.lib_command.assert_not_called()
 
@@ -374,7 +341,7 @@ class ResourceMoveBanMixin:
             self.cli_command(
                 self.lib,
                 ["resource", "arg1", "arg2", "arg3"],
-                dict_to_modifiers(dict()),
+                EMPTY_MODIFIERS,
             )
         self.assertIsNone(cm.exception.message)
         self.lib_command.assert_not_called()
@@ -384,7 +351,7 @@ class ResourceMoveBanMixin:
             self.cli_command(
                 self.lib,
                 ["resource", "node1", "node2"],
-                dict_to_modifiers(dict()),
+                EMPTY_MODIFIERS,
             )
         self.assertIsNone(cm.exception.message)
         self.lib_command.assert_not_called()
@@ -394,70 +361,42 @@ class ResourceMoveBanMixin:
             self.cli_command(
                 self.lib,
                 ["resource", "lifetime=1h", "lifetime=2h"],
-                dict_to_modifiers(dict()),
+                EMPTY_MODIFIERS,
             )
         self.assertIsNone(cm.exception.message)
         self.lib_command.assert_not_called()
 
-    def test_succes(self):
-        self.cli_command(self.lib, ["resource"], dict_to_modifiers(dict()))
-        self.lib_command.assert_called_once_with(
-            "resource", lifetime=None, master=False, node=None, wait=False
-        )
-
-    def test_success_node(self):
-        self.cli_command(
-            self.lib, ["resource", "node"], dict_to_modifiers(dict())
-        )
-        self.lib_command.assert_called_once_with(
-            "resource", lifetime=None, master=False, node="node", wait=False
-        )
-
-    def test_success_lifetime(self):
-        self.cli_command(
-            self.lib, ["resource", "lifetime=1h"], dict_to_modifiers(dict())
-        )
-        self.lib_command.assert_called_once_with(
-            "resource", lifetime="P1h", master=False, node=None, wait=False
-        )
-
-    def test_success_lifetime_unchanged(self):
-        self.cli_command(
-            self.lib, ["resource", "lifetime=T1h"], dict_to_modifiers(dict())
-        )
-        self.lib_command.assert_called_once_with(
-            "resource", lifetime="T1h", master=False, node=None, wait=False
-        )
-
-    def test_succes_node_lifetime(self):
-        self.cli_command(
-            self.lib,
-            ["resource", "node", "lifetime=1h"],
-            dict_to_modifiers(dict()),
-        )
-        self.lib_command.assert_called_once_with(
-            "resource", lifetime="P1h", master=False, node="node", wait=False
-        )
-
-    def test_success_lifetime_node(self):
-        self.cli_command(
-            self.lib,
-            ["resource", "lifetime=1h", "node"],
-            dict_to_modifiers(dict()),
-        )
-        self.lib_command.assert_called_once_with(
-            "resource", lifetime="P1h", master=False, node="node", wait=False
-        )
-
-    def test_success_all_options(self):
-        self.cli_command(
-            self.lib,
-            ["resource", "lifetime=1h", "node"],
-            dict_to_modifiers(dict(master=True, wait="10")),
-        )
-        self.lib_command.assert_called_once_with(
-            "resource", lifetime="P1h", master=True, node="node", wait="10"
-        )
+    def test_success(self):
+        default_kwargs = dict(
+            lifetime=None, master=False, node=None, wait=False
+        )
+        for argv, modifiers, kwargs in [
+            (["resource"], {}, {}),
+            (["resource", "node"], {}, dict(node="node")),
+            (["resource", "lifetime=1h"], {}, dict(lifetime="P1h")),
+            (["resource", "lifetime=T1h"], {}, dict(lifetime="T1h")),
+            (
+                ["resource", "node", "lifetime=1h"],
+                {},
+                dict(lifetime="P1h", node="node"),
+            ),
+            (
+                ["resource", "lifetime=1h", "node"],
+                {},
+                dict(lifetime="P1h", node="node"),
+            ),
+            (
+                ["resource", "lifetime=1h", "node"],
+                dict(master=True, wait="10"),
+                dict(lifetime="P1h", master=True, node="node", wait="10"),
+            ),
+        ]:
+            with self.subTest(argv=argv, modifiers=modifiers):
+                self.lib_command.reset_mock()
+                self.cli_command(self.lib, argv, dict_to_modifiers(modifiers))
+                self.lib_command.assert_called_once_with(
+                    "resource", **{**default_kwargs, **kwargs}
+                )
 
 
 class ResourceMove(ResourceMoveBanMixin, TestCase):
@@ -488,9 +427,7 @@ class ResourceClear(TestCase):
 
     def test_no_args(self):
         with self.assertRaises(CmdLineInputError) as cm:
-            resource.resource_unmove_unban(
-                self.lib, [], dict_to_modifiers(dict())
-            )
+            resource.resource_unmove_unban(self.lib, [], EMPTY_MODIFIERS)
         self.assertEqual(
             cm.exception.message, "must specify a resource to clear"
         )
@@ -501,22 +438,20 @@ class ResourceClear(TestCase):
             resource.resource_unmove_unban(
                 self.lib,
                 ["resource", "arg1", "arg2"],
-                dict_to_modifiers(dict()),
+                EMPTY_MODIFIERS,
             )
         self.assertIsNone(cm.exception.message)
         self.resource.unmove_unban.assert_not_called()
 
     def test_succes(self):
-        resource.resource_unmove_unban(
-            self.lib, ["resource"], dict_to_modifiers(dict())
-        )
+        resource.resource_unmove_unban(self.lib, ["resource"], EMPTY_MODIFIERS)
         self.resource.unmove_unban.assert_called_once_with(
             "resource", node=None, master=False, expired=False, wait=False
         )
 
     def test_success_node(self):
         resource.resource_unmove_unban(
-            self.lib, ["resource", "node"], dict_to_modifiers(dict())
+            self.lib, ["resource", "node"], EMPTY_MODIFIERS
         )
         self.resource.unmove_unban.assert_called_once_with(
             "resource", node="node", master=False, expired=False, wait=False
@@ -536,9 +471,7 @@ class ResourceClear(TestCase):
 class ResourceDisable(TestCase):
     def setUp(self):
         self.lib = mock.Mock(spec_set=["resource"])
-        self.resource = mock.Mock(
-            spec_set=["disable", "disable_safe", "disable_simulate"]
-        )
+        self.resource = mock.Mock(spec_set=RESOURCE_DISABLE_SPEC)
         self.lib.resource = self.resource
 
     @staticmethod
@@ -552,9 +485,7 @@ class ResourceDisable(TestCase):
 
     def test_no_args(self):
         with self.assertRaises(CmdLineInputError) as cm:
-            resource.resource_disable_cmd(
-                self.lib, [], dict_to_modifiers(dict())
-            )
+            resource.resource_disable_cmd(self.lib, [], EMPTY_MODIFIERS)
         self.assertEqual(
             cm.exception.message, "You must specify resource(s) to disable"
         )
@@ -563,17 +494,13 @@ class ResourceDisable(TestCase):
         self.resource.disable_simulate.assert_not_called()
 
     def test_one_resource(self):
-        resource.resource_disable_cmd(
-            self.lib, ["R1"], dict_to_modifiers(dict())
-        )
+        resource.resource_disable_cmd(self.lib, ["R1"], EMPTY_MODIFIERS)
         self.resource.disable.assert_called_once_with(["R1"], False)
         self.resource.disable_safe.assert_not_called()
         self.resource.disable_simulate.assert_not_called()
 
     def test_more_resources(self):
-        resource.resource_disable_cmd(
-            self.lib, ["R1", "R2"], dict_to_modifiers(dict())
-        )
+        resource.resource_disable_cmd(self.lib, ["R1", "R2"], EMPTY_MODIFIERS)
         self.resource.disable.assert_called_once_with(["R1", "R2"], False)
         self.resource.disable_safe.assert_not_called()
         self.resource.disable_simulate.assert_not_called()
@@ -727,9 +654,7 @@ class ResourceDisable(TestCase):
 class ResourceSafeDisable(TestCase):
     def setUp(self):
         self.lib = mock.Mock(spec_set=["resource"])
-        self.resource = mock.Mock(
-            spec_set=["disable", "disable_safe", "disable_simulate"]
-        )
+        self.resource = mock.Mock(spec_set=RESOURCE_DISABLE_SPEC)
         self.lib.resource = self.resource
         self.force_warning = (
             "option '--force' is specified therefore checks for disabling "
@@ -747,9 +672,7 @@ class ResourceSafeDisable(TestCase):
 
     def test_no_args(self):
         with self.assertRaises(CmdLineInputError) as cm:
-            resource.resource_safe_disable_cmd(
-                self.lib, [], dict_to_modifiers({})
-            )
+            resource.resource_safe_disable_cmd(self.lib, [], EMPTY_MODIFIERS)
         self.assertEqual(
             cm.exception.message, "You must specify resource(s) to disable"
         )
@@ -758,16 +681,14 @@ class ResourceSafeDisable(TestCase):
         self.resource.disable_simulate.assert_not_called()
 
     def test_one_resource(self):
-        resource.resource_safe_disable_cmd(
-            self.lib, ["R1"], dict_to_modifiers({})
-        )
+        resource.resource_safe_disable_cmd(self.lib, ["R1"], EMPTY_MODIFIERS)
         self.resource.disable_safe.assert_called_once_with(["R1"], True, False)
         self.resource.disable.assert_not_called()
         self.resource.disable_simulate.assert_not_called()
 
     def test_more_resources(self):
         resource.resource_safe_disable_cmd(
-            self.lib, ["R1", "R2"], dict_to_modifiers({})
+            self.lib, ["R1", "R2"], EMPTY_MODIFIERS
         )
         self.resource.disable_safe.assert_called_once_with(
             ["R1", "R2"], True, False
@@ -893,35 +814,6 @@ class ResourceSafeDisable(TestCase):
         self.resource.disable_safe.assert_not_called()
         mock_print.assert_not_called()
 
-    def test_simulate_wait(self):
-        with self.assertRaises(CmdLineInputError) as cm:
-            resource.resource_safe_disable_cmd(
-                self.lib,
-                ["R1"],
-                dict_to_modifiers(dict(simulate=True, wait=True)),
-            )
-        self.assertEqual(
-            cm.exception.message,
-            "Only one of '--simulate', '--wait' can be used",
-        )
-        self.resource.disable.assert_not_called()
-        self.resource.disable_safe.assert_not_called()
-        self.resource.disable_simulate.assert_not_called()
-
-    def test_simulate_force(self):
-        with self.assertRaises(CmdLineInputError) as cm:
-            resource.resource_safe_disable_cmd(
-                self.lib,
-                ["R1"],
-                dict_to_modifiers(dict(simulate=True, force=True)),
-            )
-        self.assertEqual(
-            cm.exception.message, "'--force' cannot be used with '--simulate'"
-        )
-        self.resource.disable.assert_not_called()
-        self.resource.disable_safe.assert_not_called()
-        self.resource.disable_simulate.assert_not_called()
-
     @mock.patch("pcs.resource.print")
     def test_simulate_no_strict(self, mock_print):
         self.resource.disable_simulate.return_value = self._fixture_output()
@@ -935,36 +827,34 @@ class ResourceSafeDisable(TestCase):
         self.resource.disable_safe.assert_not_called()
         mock_print.assert_called_once_with("simulate output")
 
-    def test_simulate_no_strict_force(self):
-        with self.assertRaises(CmdLineInputError) as cm:
-            resource.resource_safe_disable_cmd(
-                self.lib,
-                ["R1"],
-                dict_to_modifiers(
-                    {"simulate": True, "no-strict": True, "force": True}
-                ),
-            )
-        self.assertEqual(
-            cm.exception.message,
-            "'--force' cannot be used with '--no-strict', '--simulate'",
-        )
-        self.resource.disable.assert_not_called()
-        self.resource.disable_safe.assert_not_called()
-        self.resource.disable_simulate.assert_not_called()
-
-    def test_force_no_strict(self):
-        with self.assertRaises(CmdLineInputError) as cm:
-            resource.resource_safe_disable_cmd(
-                self.lib,
-                ["R1"],
-                dict_to_modifiers({"force": True, "no-strict": True}),
-            )
-        self.assertEqual(
-            cm.exception.message, "'--force' cannot be used with '--no-strict'"
-        )
-        self.resource.disable.assert_not_called()
-        self.resource.disable_safe.assert_not_called()
-        self.resource.disable_simulate.assert_not_called()
+    def test_incompatible_modifiers(self):
+        for modifiers, error in [
+            (
+                dict(simulate=True, wait=True),
+                "Only one of '--simulate', '--wait' can be used",
+            ),
+            (
+                dict(simulate=True, force=True),
+                "'--force' cannot be used with '--simulate'",
+            ),
+            (
+                {"simulate": True, "no-strict": True, "force": True},
+                "'--force' cannot be used with '--no-strict', '--simulate'",
+            ),
+            (
+                {"force": True, "no-strict": True},
+                "'--force' cannot be used with '--no-strict'",
+            ),
+        ]:
+            with self.subTest(modifiers=modifiers):
+                with self.assertRaises(CmdLineInputError) as cm:
+                    resource.resource_safe_disable_cmd(
+                        self.lib, ["R1"], dict_to_modifiers(modifiers)
+                    )
+                self.assertEqual(cm.exception.message, error)
+                self.resource.disable.assert_not_called()
+                self.resource.disable_safe.assert_not_called()
+                self.resource.disable_simulate.assert_not_called()
 
 
 class ResourceEnable(TestCase):
@@ -975,24 +865,18 @@ class ResourceEnable(TestCase):
 
     def test_no_args(self):
         with self.assertRaises(CmdLineInputError) as cm:
-            resource.resource_enable_cmd(
-                self.lib, [], dict_to_modifiers(dict())
-            )
+            resource.resource_enable_cmd(self.lib, [], EMPTY_MODIFIERS)
         self.assertEqual(
             cm.exception.message, "You must specify resource(s) to enable"
         )
         self.resource.enable.assert_not_called()
 
     def test_one_resource(self):
-        resource.resource_enable_cmd(
-            self.lib, ["R1"], dict_to_modifiers(dict())
-        )
+        resource.resource_enable_cmd(self.lib, ["R1"], EMPTY_MODIFIERS)
         self.resource.enable.assert_called_once_with(["R1"], False)
 
     def test_more_resources(self):
-        resource.resource_enable_cmd(
-            self.lib, ["R1", "R2"], dict_to_modifiers(dict())
-        )
+        resource.resource_enable_cmd(self.lib, ["R1", "R2"], EMPTY_MODIFIERS)
         self.resource.enable.assert_called_once_with(["R1", "R2"], False)
 
     def test_wait(self):
@@ -1004,85 +888,49 @@ class ResourceEnable(TestCase):
         self.resource.enable.assert_called_once_with(["R1", "R2"], "10")
 
 
-class ResourceManage(TestCase):
-    def setUp(self):
-        self.lib = mock.Mock(spec_set=["resource"])
-        self.resource = mock.Mock(spec_set=["manage"])
-        self.lib.resource = self.resource
-
+class ResourceManageUnmanageMixin:
     def test_no_args(self):
         with self.assertRaises(CmdLineInputError) as cm:
-            resource.resource_manage_cmd(
-                self.lib, [], dict_to_modifiers(dict())
-            )
-        self.assertEqual(
-            cm.exception.message, "You must specify resource(s) to manage"
-        )
-        self.resource.manage.assert_not_called()
+            self.cli_command(self.lib, [], EMPTY_MODIFIERS)
+        self.assertEqual(cm.exception.message, self.no_args_error)
+        self.lib_command.assert_not_called()
 
     def test_one_resource(self):
-        resource.resource_manage_cmd(
-            self.lib, ["R1"], dict_to_modifiers(dict())
-        )
-        self.resource.manage.assert_called_once_with(["R1"], with_monitor=False)
+        self.cli_command(self.lib, ["R1"], EMPTY_MODIFIERS)
+        self.lib_command.assert_called_once_with(["R1"], with_monitor=False)
 
     def test_more_resources(self):
-        resource.resource_manage_cmd(
-            self.lib, ["R1", "R2"], dict_to_modifiers(dict())
-        )
-        self.resource.manage.assert_called_once_with(
+        self.cli_command(self.lib, ["R1", "R2"], EMPTY_MODIFIERS)
+        self.lib_command.assert_called_once_with(
             ["R1", "R2"], with_monitor=False
         )
 
     def test_monitor(self):
-        resource.resource_manage_cmd(
+        self.cli_command(
             self.lib,
             ["R1", "R2"],
             dict_to_modifiers(dict(monitor=True)),
         )
-        self.resource.manage.assert_called_once_with(
+        self.lib_command.assert_called_once_with(
             ["R1", "R2"], with_monitor=True
         )
 
 
-class ResourceUnmanage(TestCase):
+class ResourceManage(ResourceManageUnmanageMixin, TestCase):
     def setUp(self):
         self.lib = mock.Mock(spec_set=["resource"])
-        self.resource = mock.Mock(spec_set=["unmanage"])
+        self.resource = mock.Mock(spec_set=["manage"])
         self.lib.resource = self.resource
+        self.lib_command = self.resource.manage
+        self.cli_command = resource.resource_manage_cmd
+        self.no_args_error = "You must specify resource(s) to manage"
 
-    def test_no_args(self):
-        with self.assertRaises(CmdLineInputError) as cm:
-            resource.resource_unmanage_cmd(
-                self.lib, [], dict_to_modifiers(dict())
-            )
-        self.assertEqual(
-            cm.exception.message, "You must specify resource(s) to unmanage"
-        )
-        self.resource.unmanage.assert_not_called()
 
-    def test_one_resource(self):
-        resource.resource_unmanage_cmd(
-            self.lib, ["R1"], dict_to_modifiers(dict())
-        )
-        self.resource.unmanage.assert_called_once_with(
-            ["R1"], with_monitor=False
-        )
-
-    def test_more_resources(self):
-        resource.resource_unmanage_cmd(
-            self.lib, ["R1", "R2"], dict_to_modifiers(dict())
-        )
-        self.resource.unmanage.assert_called_once_with(
-            ["R1", "R2"], with_monitor=False
-        )
-
-    def test_monitor(self):
-        resource.resource_unmanage_cmd(
-            self.lib,
-            ["R1", "R2"],
-            dict_to_modifiers(dict(monitor=True)),
-        )
-        self.resource.unmanage.assert_called_once_with(
-            ["R1", "R2"], with_monitor=True
-        )
+class ResourceUnmanage(ResourceManageUnmanageMixin, TestCase):
+    def setUp(self):
+        self.lib = mock.Mock(spec_set=["resource"])
+        self.resource = mock.Mock(spec_set=["unmanage"])
+        self.lib.resource = self.resource
+        self.lib_command = self.resource.unmanage
+        self.cli_command = resource.resource_unmanage_cmd
+        self.no_args_error = "You must specify resource(s) to unmanage"
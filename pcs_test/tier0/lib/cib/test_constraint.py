@@ -16,14 +16,13 @@ from pcs.lib.cib.constraint import constraint
 # pylint: disable=no-self-use, redundant-keyword-arg
 
 
-def fixture_element(tag, _id):
-    element = mock.MagicMock()
-    element.tag = tag
-    element.attrib = {"id": _id}
-    return element
+def fixture_element(tag, _id, parent_tag=None, parent_id=None):
+    if parent_tag is None:
+        return etree.Element(tag, id=_id)
+    parent = etree.Element(parent_tag, id=parent_id)
+    return etree.SubElement(etree.SubElement(parent, "group"), tag, id=_id)
 
 
-@mock.patch("pcs.lib.cib.constraint.constraint.find_parent")
 @mock.patch("pcs.lib.cib.constraint.constraint.find_element_by_tag_and_id")
 class FindValidResourceId(TestCase):
     def setUp(self):
@@ -62,60 +61,55 @@ class FindValidResourceId(TestCase):
             None,
         )
 
-    def test_return_same_id_when_resource_is_clone(self, mock_find_by_id, _):
+    def test_return_same_id_when_resource_is_clone(self, mock_find_by_id):
         mock_find_by_id.return_value = fixture_element("clone", "resourceA")
         self.assertEqual("resourceA", self.find(_id="resourceA"))
 
-    def test_return_same_id_when_resource_is_master(self, mock_find_by_id, _):
+    def test_return_same_id_when_resource_is_master(self, mock_find_by_id):
         mock_find_by_id.return_value = fixture_element("master", "resourceA")
         self.assertEqual("resourceA", self.find(_id="resourceA"))
 
-    def test_return_same_id_when_resource_is_bundle(self, mock_find_by_id, _):
+    def test_return_same_id_when_resource_is_bundle(self, mock_find_by_id):
         mock_find_by_id.return_value = fixture_element("bundle", "resourceA")
         self.assertEqual("resourceA", self.find(_id="resourceA"))
 
     def test_return_same_id_when_resource_is_standalone_primitive(
-        self, mock_find_by_id, mock_find_parent
+        self, mock_find_by_id
     ):
         mock_find_by_id.return_value = fixture_element("primitive", "resourceA")
-        mock_find_parent.return_value = None
         self.assertEqual("resourceA", self.find(_id="resourceA"))
 
-    def test_refuse_when_resource_is_in_clone(
-        self, mock_find_by_id, mock_find_parent
-    ):
-        mock_find_by_id.return_value = fixture_element("primitive", "resourceA")
-        mock_find_parent.return_value = fixture_element("clone", "clone_id")
+    def test_refuse_when_resource_is_in_clone(self, mock_find_by_id):
+        mock_find_by_id.return_value = fixture_element(
+            "primitive", "resourceA", "clone", "clone_id"
+        )
         assert_raise_library_error(
             lambda: self.find(_id="resourceA"),
             self.fixture_error_multiinstance("clone", "clone_id"),
         )
 
-    def test_refuse_when_resource_is_in_master(
-        self, mock_find_by_id, mock_find_parent
-    ):
-        mock_find_by_id.return_value = fixture_element("primitive", "resourceA")
-        mock_find_parent.return_value = fixture_element("master", "master_id")
+    def test_refuse_when_resource_is_in_master(self, mock_find_by_id):
+        mock_find_by_id.return_value = fixture_element(
+            "primitive", "resourceA", "master", "master_id"
+        )
         assert_raise_library_error(
             lambda: self.find(_id="resourceA"),
             self.fixture_error_multiinstance("clone", "master_id"),
         )
 
-    def test_refuse_when_resource_is_in_bundle(
-        self, mock_find_by_id, mock_find_parent
-    ):
-        mock_find_by_id.return_value = fixture_element("primitive", "resourceA")
-        mock_find_parent.return_value = fixture_element("bundle", "bundle_id")
+    def test_refuse_when_resource_is_in_bundle(self, mock_find_by_id):
+        mock_find_by_id.return_value = fixture_element(
+            "primitive", "resourceA", "bundle", "bundle_id"
+        )
         assert_raise_library_error(
             lambda: self.find(_id="resourceA"),
             self.fixture_error_multiinstance("bundle", "bundle_id"),
         )
 
-    def test_return_resource_id_when_in_clone_allowed(
-        self, mock_find_by_id, mock_find_parent
-    ):
-        mock_find_by_id.return_value = fixture_element("primitive", "resourceA")
-        mock_find_parent.return_value = fixture_element("clone", "clone_id")
+    def test_return_resource_id_when_in_clone_allowed(self, mock_find_by_id):
+        mock_find_by_id.return_value = fixture_element(
+            "primitive", "resourceA", "clone", "clone_id"
+        )
 
         self.assertEqual(
             "resourceA", self.find(in_clone_allowed=True, _id="resourceA")
@@ -127,11 +121,10 @@ class FindValidResourceId(TestCase):
             ],
         )
 
-    def test_return_resource_id_when_in_master_allowed(
-        self, mock_find_by_id, mock_find_parent
-    ):
-        mock_find_by_id.return_value = fixture_element("primitive", "resourceA")
-        mock_find_parent.return_value = fixture_element("master", "master_id")
+    def test_return_resource_id_when_in_master_allowed(self, mock_find_by_id):
+        mock_find_by_id.return_value = fixture_element(
+            "primitive", "resourceA", "master", "master_id"
+        )
 
         self.assertEqual(
             "resourceA", self.find(in_clone_allowed=True, _id="resourceA")
@@ -143,11 +136,10 @@ class FindValidResourceId(TestCase):
             ],
         )
 
-    def test_return_resource_id_when_in_bundle_allowed(
-        self, mock_find_by_id, mock_find_parent
-    ):
-        mock_find_by_id.return_value = fixture_element("primitive", "resourceA")
-        mock_find_parent.return_value = fixture_element("bundle", "bundle_id")
+    def test_return_resource_id_when_in_bundle_allowed(self, mock_find_by_id):
+        mock_find_by_id.return_value = fixture_element(
+            "primitive", "resourceA", "bundle", "bundle_id"
+        )
 
         self.assertEqual(
             "resourceA", self.find(in_clone_allowed=True, _id="resourceA")
@@ -227,10 +219,10 @@ class CreateIdTest(TestCase):
         mock_find_id.assert_called_once_with("cib", "PREFIX_set_AABBCC")
 
 
-def fixture_constraint_section(return_value):
-    constraint_section = mock.MagicMock()
-    constraint_section.findall = mock.MagicMock()
-    constraint_section.findall.return_value = return_value
+def fixture_constraint_section(element_list):
+    constraint_section = etree.Element("constraints")
+    for element in element_list:
+        constraint_section.append(element)
     return constraint_section
 
 
@@ -244,7 +236,11 @@ class CheckIsWithoutDuplicationTest(TestCase):
             lambda: constraint.check_is_without_duplication(
                 report_processor,
                 fixture_constraint_section(
-                    [etree.Element("tag", {"id": "duplicate_element"})]
+                    [
+                        etree.Element(
+                            "constraint_type", {"id": "duplicate_element"}
+                        )
+                    ]
                 ),
                 element,
                 are_duplicate=lambda e1, e2: True,
@@ -292,6 +288,23 @@ class CheckIsWithoutDuplicationTest(TestCase):
             are_duplicate=lambda e1, e2: True,
             export_element=constraint.export_with_set,
         )
+        export_with_set.assert_not_called()
+
+    def test_no_export_when_no_duplicate_found(self):
+        element = etree.Element("constraint_type", {"id": "new"})
+        export_element = mock.Mock()
+        report_processor = MockLibraryReportProcessor()
+        constraint.check_is_without_duplication(
+            report_processor,
+            fixture_constraint_section(
+                [etree.Element("constraint_type", {"id": "other"}), element]
+            ),
+            element,
+            are_duplicate=lambda e1, e2: False,
+            export_element=export_element,
+        )
+        export_element.assert_not_called()
+        self.assertEqual(report_processor.report_item_list, [])
 
     def test_report_when_duplication_allowed(self):
         element = mock.MagicMock()
@@ -301,7 +314,7 @@ class CheckIsWithoutDuplicationTest(TestCase):
         constraint.check_is_without_duplication(
             report_processor,
             fixture_constraint_section(
-                [etree.Element("tag", {"id": "duplicate_element"})]
+                [etree.Element("constraint_type", {"id": "duplicate_element"})]
             ),
             element,
             are_duplicate=lambda e1, e2: True,
@@ -358,6 +371,39 @@ class CreateWithSetTest(TestCase):
         """,
         )
 
+    def test_create_unique_resource_set_ids(self):
+        constraint_section = etree.SubElement(
+            etree.Element("cib"), "constraints"
+        )
+        constraint.create_with_set(
+            constraint_section,
+            "rsc_order",
+            {"id": "order"},
+            [
+                {"ids": ["A"], "options": {}},
+                {"ids": ["B"], "options": {}},
+                {"ids": ["C"], "options": {}},
+            ],
+        )
+        assert_xml_equal(
+            etree.tostring(constraint_section).decode(),
+            """
+            <constraints>
+                <rsc_order id="order">
+                    <resource_set id="order_set">
+                        <resource_ref id="A"/>
+                    </resource_set>
+                    <resource_set id="order_set-1">
+                        <resource_ref id="B"/>
+                    </resource_set>
+                    <resource_set id="order_set-2">
+                        <resource_ref id="C"/>
+                    </resource_set>
+                </rsc_order>
+            </constraints>
+        """,
+        )
+
     def test_refuse_empty_resource_set_list(self):
         constraint_section = etree.Element("constraints")
         assert_raise_library_error(
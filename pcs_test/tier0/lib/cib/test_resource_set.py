@@ -9,6 +9,7 @@ from pcs_test.tools.assertions import (
 from pcs.common.reports import ReportItemSeverity as severities
 from pcs.common.reports import codes as report_codes
 from pcs.lib.cib.constraint import resource_set
+from pcs.lib.cib.tools import IdProvider
 
 # pylint: disable=no-self-use
 
@@ -68,6 +69,7 @@ class CreateTest(TestCase):
         resource_set.create(
             constraint_element,
             {"ids": ["A", "B"], "options": {"sequential": "true"}},
+            IdProvider(constraint_element),
         )
         assert_xml_equal(
             etree.tostring(constraint_element).decode(),
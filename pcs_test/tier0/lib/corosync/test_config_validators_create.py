@@ -1,5 +1,5 @@
 # pylint: disable=too-many-lines
-from unittest import TestCase
+from unittest import mock, TestCase
 
 from pcs_test.tier0.lib.corosync.test_config_validators_common import (
     TotemBase,
@@ -8,7 +8,10 @@ from pcs_test.tier0.lib.corosync.test_config_validators_common import (
 )
 from pcs_test.tools import fixture
 from pcs_test.tools.assertions import assert_report_item_list_equal
-from pcs_test.tools.custom_mock import patch_getaddrinfo
+from pcs_test.tools.custom_mock import (
+    get_getaddrinfo_mock,
+    patch_getaddrinfo,
+)
 
 from pcs.common.reports import codes as report_codes
 from pcs.lib.corosync import config_validators
@@ -499,6 +502,40 @@ class Create(TestCase):
             ],
         )
 
+    def test_node_addrs_resolution_error(self):
+        # an error other than unresolvable address is not hidden by resolving
+        # addresses in advance
+        with mock.patch(
+            "socket.getaddrinfo", side_effect=UnicodeError("label too long")
+        ):
+            with self.assertRaises(UnicodeError):
+                config_validators.create(
+                    "test-cluster",
+                    [{"name": "node1", "addrs": ["addrX1"]}],
+                    "knet",
+                    "ipv4",
+                )
+
+    def test_node_addrs_resolved_once(self):
+        getaddrinfo = mock.Mock(
+            side_effect=get_getaddrinfo_mock(self.known_addrs)
+        )
+        with mock.patch("socket.getaddrinfo", getaddrinfo):
+            config_validators.create(
+                "test-cluster",
+                [
+                    {"name": "node1", "addrs": ["addr01", "10.0.0.1"]},
+                    {"name": "node2", "addrs": ["addr02", "addrX1"]},
+                    {"name": "node3", "addrs": ["addr01", "addrX1"]},
+                ],
+                "knet",
+                "ipv4",
+            )
+        self.assertEqual(
+            sorted(call_args[0][0] for call_args in getaddrinfo.call_args_list),
+            ["addr01", "addr02", "addrX1"],
+        )
+
     def test_node_addrs_matching_ip_version_ipv4(self):
         assert_report_item_list_equal(
             config_validators.create(